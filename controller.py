@@ -1,9 +1,23 @@
-from typing import List
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 
 from model import Book
-from repository import Repository
+from repository import DEFAULT_PAGE_SIZE, LOAN_PAGE_SIZE, empty_book_columns, get_repository
 from utils import logger
 
+# Publishers and members change rarely, so their listings are kept for a minute.
+_LOOKUP_CACHE = TTLCache(maxsize=8, ttl=60)
+# Queries run on worker threads, so cache access is serialised.
+_LOOKUP_LOCK = threading.RLock()
+
+
+def _lookup_key(name: str) -> Callable:
+    """Builds a cache key function that ignores the controller instance."""
+    return lambda _self, *args, **kwargs: hashkey(name, *args, **kwargs)
+
 
 class BookController:
     """
@@ -11,21 +25,25 @@ class BookController:
     """
 
     def __init__(self) -> None:
-        """Initializes the BookController with a repository instance."""
-        self.repository = Repository()
+        """Initializes the BookController with the shared repository instance."""
+        self.repository = get_repository()
 
-    def getall(self) -> List[Book]:
+    def getall_columnar(self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0) -> Dict[str, Sequence]:
         """
-        Fetches all books from the repository.
+        Fetches a page of books from the repository as one column per Book field.
+
+        Args:
+            limit (int): The maximum number of books to return.
+            offset (int): The number of books to skip.
 
         Returns:
-            List[Book]: A list of Book objects.
+            Dict[str, Sequence]: A mapping from Book field name to its column of values.
         """
         try:
-            return self.repository.fetchall_books()
+            return self.repository.fetchall_books_columnar(limit=limit, offset=offset)
         except Exception as e:
             logger.error(f"Failed to fetch all books: {e}")
-            return []
+            return empty_book_columns()
 
     def add_book(self, title: str, author: str, publisher: int, isbn: str, year_published: int) -> None:
         """
@@ -37,11 +55,11 @@ class BookController:
         book = Book(
             id=0,  # Placeholder for auto-generated ID
             title=title,
-            author=author,
-            publisher_id=publisher,
             isbn=isbn,
-            year_published=year_published,
-            genre_id=1  # Default genre_id
+            pub_year=year_published,
+            genre_id=1,  # Default genre_id
+            publisher_id=publisher,
+            authors=author
         )
         try:
             self.repository.add_book(book=book)
@@ -59,11 +77,11 @@ class BookController:
         book = Book(
             id=bid,
             title=title,
-            author=author,
-            publisher_id=publisher_id,
             isbn=isbn,
-            year_published=year,
-            genre_id=1  # Default genre_id or retrieve current genre_id as needed
+            pub_year=year,
+            genre_id=1,  # Default genre_id or retrieve current genre_id as needed
+            publisher_id=publisher_id,
+            authors=author
         )
         try:
             self.repository.update_book(book)
@@ -79,11 +97,10 @@ class QueryController:
     """
 
     def __init__(self) -> None:
-        """Initializes the QueryController with a repository instance."""
-        self.repository = Repository()
+        """Initializes the QueryController with the shared repository instance."""
+        self.repository = get_repository()
 
     def get_books_by_author_name(self, author_name: str) -> List[Book]:
-
         """
         Fetches books by the given author.
 
@@ -95,40 +112,59 @@ class QueryController:
         """
         try:
             books = self.repository.get_books_by_author(author_name)
-            if books is None:
-                QMessageBox.warning(self, "Warning", "No books found for the given author.")
-                return
-            return self.repository.get_books_by_author(author_name)
+            if not books:
+                logger.info(f"No books found for author '{author_name}'.")
+                return []
+            return books
         except Exception as e:
             logger.error(f"Failed to fetch books by author '{author_name}': {e}")
             return []
 
-    def list_all_publisher(self) -> List:
+    def list_all_publisher(self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0) -> List:
         """
-        Fetches all publisher from the repository.
+        Fetches a page of publishers from the repository.
+
+        Args:
+            limit (int): The maximum number of publishers to return.
+            offset (int): The number of publishers to skip.
 
         Returns:
             List[Publisher]: A list of Publisher objects.
         """
         try:
-            return self.repository.get_publisher()
+            return self._cached_publishers(limit, offset)
         except Exception as e:
             logger.error(f"Failed to fetch publisher: {e}")
             return []
 
-    def get_all_members(self) -> List:
+    def get_all_members(self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0) -> List:
         """
-        Fetches all members from the repository.
+        Fetches a page of members from the repository.
+
+        Args:
+            limit (int): The maximum number of members to return.
+            offset (int): The number of members to skip.
 
         Returns:
             List[Member]: A list of Member objects.
         """
         try:
-            return self.repository.get_all_members()
+            return self._cached_members(limit, offset)
         except Exception as e:
             logger.error(f"Failed to fetch members: {e}")
             return []
 
+    # Only successful lookups are cached: a repository error propagates through
+    # these helpers before anything is stored.
+
+    @cached(_LOOKUP_CACHE, key=_lookup_key("publisher"), lock=_LOOKUP_LOCK)
+    def _cached_publishers(self, limit: int, offset: int) -> List:
+        return self.repository.get_publisher(limit=limit, offset=offset)
+
+    @cached(_LOOKUP_CACHE, key=_lookup_key("members"), lock=_LOOKUP_LOCK)
+    def _cached_members(self, limit: int, offset: int) -> List:
+        return self.repository.get_all_members(limit=limit, offset=offset)
+
     def list_all_members_by_book(self, book_name: str) -> List[tuple]:
         """
         Fetches all members who have borrowed the specified book.
@@ -145,15 +181,19 @@ class QueryController:
             logger.error(f"Failed to fetch members by book '{book_name}': {e}")
             return []
 
-    def get_all_loan(self) -> List[tuple]:
+    def get_recent_loans(self, before_id: Optional[int] = None, page_size: int = LOAN_PAGE_SIZE) -> List[tuple]:
         """
-        Fetches all loan records from the repository.
+        Fetches a page of loan records from the repository, newest first.
+
+        Args:
+            before_id (Optional[int]): The last loan_id of the previous page, or None for the first page.
+            page_size (int): The maximum number of loans to return.
 
         Returns:
             List[tuple]: A list of tuples containing loan information.
         """
         try:
-            return self.repository.list_all_loan()
+            return self.repository.list_recent_loans(before_id=before_id, page_size=page_size)
         except Exception as e:
             logger.error(f"Failed to fetch loan records: {e}")
             return []
@@ -1,9 +1,20 @@
 import os
-from typing import Any, List, Tuple, Optional
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, List, Tuple, Optional
 
 import psycopg2 as pg
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from psycopg2 import OperationalError, Error
+from psycopg2.extras import execute_batch
+from psycopg2.pool import ThreadedConnectionPool
+
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = 8
+QUERY_CACHE_SIZE = 128
+# Bounds how stale a cached result can get when another client writes to the database.
+QUERY_CACHE_TTL = 30
 
 
 class Database:
@@ -17,7 +28,14 @@ class Database:
         self.host = os.getenv("HOST")
         self.port = os.getenv("PORT")
 
-        self.connection: Optional[pg.extensions.connection] = None
+        self.pool: Optional[ThreadedConnectionPool] = None
+
+        # Results of fetch_results keyed by (query, params); expired after QUERY_CACHE_TTL
+        # seconds and cleared on every write. The generation changes on each clear, so a read
+        # that started before a write does not store its now outdated rows.
+        self._query_cache = TTLCache(maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL)
+        self._query_cache_generation = 0
+        self._query_cache_lock = threading.Lock()
 
     @staticmethod
     def load_configuration():
@@ -25,7 +43,9 @@ class Database:
 
     def connect(self) -> None:
         try:
-            self.connection = pg.connect(
+            self.pool = ThreadedConnectionPool(
+                minconn = POOL_MIN_CONNECTIONS,
+                maxconn = POOL_MAX_CONNECTIONS,
                 dbname = self.dbname,
                 user = self.user,
                 password = self.password,
@@ -36,32 +56,88 @@ class Database:
             raise RuntimeError(f"Error connecting to the database: {e}")
 
     def close(self) -> None:
-        if self.connection:
+        if self.pool:
             try:
-                self.connection.close()
+                self.pool.closeall()
             except Error as e:
-                raise RuntimeError(f"Error closing the connection: {e}")
+                raise RuntimeError(f"Error closing the connection pool: {e}")
+            finally:
+                self.pool = None
 
-    def execute_query(self, query: str, params: Optional[Tuple[Any, ...]] = None) -> None:
-        if not self.connection:
+    @contextmanager
+    def connection(self) -> Iterator[pg.extensions.connection]:
+        """Borrows a connection from the pool and returns it once the block exits."""
+        if not self.pool:
             raise RuntimeError("Connection is not established.")
+        connection = self.pool.getconn()
+        broken = False
+        try:
+            # The connection context commits on success and rolls back on error.
+            with connection:
+                yield connection
+        except (OperationalError, pg.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self.pool.putconn(connection, close=broken or bool(connection.closed))
+
+    def clear_query_cache(self) -> None:
+        with self._query_cache_lock:
+            self._query_cache.clear()
+            self._query_cache_generation += 1
+
+    def execute_query(self, query: str, params: Optional[Tuple[Any, ...]] = None) -> None:
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, params)
-                self.connection.commit()
+            with self.connection() as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, params)
         except Error as e:
-            self.close()
             raise RuntimeError(f"Error executing query: {e}")
+        finally:
+            self.clear_query_cache()
+
+    def execute_many(self, query: str, params_seq: Iterable[Tuple[Any, ...]]) -> None:
+        """
+        Executes the query once per parameter tuple inside a single transaction.
+        Statements are sent to the server in batches rather than one round trip each,
+        and nothing is committed if any of them fails.
+        """
+        try:
+            with self.connection() as connection:
+                with connection.cursor() as cursor:
+                    execute_batch(cursor, query, params_seq)
+        except Error as e:
+            raise RuntimeError(f"Error executing query: {e}")
+        finally:
+            self.clear_query_cache()
+
+    def fetch_results(
+        self, query: str, params: Optional[Tuple[Any, ...]] = None, bypass_cache: bool = False
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Returns all rows of the query. Identical (query, params) pairs are answered from
+        the query cache for up to QUERY_CACHE_TTL seconds or until the next write;
+        pass bypass_cache=True to always hit the database.
+        """
+        key = (query, params)
+        if not bypass_cache:
+            with self._query_cache_lock:
+                cached = self._query_cache.get(key)
+                generation = self._query_cache_generation
+            if cached is not None:
+                return list(cached)
 
-    def fetch_results(self, query: str, params: Optional[Tuple[Any, ...]] = None) -> List[Tuple[Any, ...]]:
-        if not self.connection:
-            raise RuntimeError("Connection is not established.")
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, params)
-                results = cursor.fetchall()
-                return results
+            with self.connection() as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, params)
+                    results = cursor.fetchall()
         except Error as e:
-            self.close()
             raise RuntimeError(f"Error fetching results: {e}")
 
+        if not bypass_cache:
+            with self._query_cache_lock:
+                if generation == self._query_cache_generation:
+                    # Stored as a tuple so no caller can mutate the cached rows.
+                    self._query_cache[key] = tuple(results)
+        return results
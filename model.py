@@ -1,27 +1,29 @@
-from dataclasses import dataclass
+from typing import NamedTuple, Optional
 
-@dataclass
-class Book:
-    id: int             
+
+class Book(NamedTuple):
+    id: int
     title: str
     isbn: str
-    pub_year: int        
-    genre_id: int        
-    publisher_id: int    
+    pub_year: int
+    genre_id: int
+    publisher_id: int
+    authors: Optional[str] = None
+
 
-@dataclass
-class Publisher:
-    id: int              
+class Publisher(NamedTuple):
+    id: int
     name: str
     address: str
     phone: str
     email: str
 
-@dataclass
-class Member:
-    id: int         
+
+class Member(NamedTuple):
+    id: int
     first_name: str
     last_name: str
     address: str
     email: str
-    membership_date: str
\ No newline at end of file
+    membership_date: str
+
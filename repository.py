@@ -1,9 +1,147 @@
-from typing import List, Optional
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
 
 from database import Database
 from model import Book, Publisher, Member
 from utils import logger
 
+DEFAULT_PAGE_SIZE = 500
+LOAN_PAGE_SIZE = 200
+
+_SQL_FETCHALL_BOOKS = """
+    SELECT b.book_id,
+           b.title,
+           b.isbn,
+           b.pub_year,
+           b.genre_id,
+           b.publisher_id,
+           string_agg(a.name, ', ' ORDER BY a.name) AS authors
+      FROM book b
+      LEFT JOIN book_author ba ON b.book_id = ba.book_id
+      LEFT JOIN author a ON ba.author_id = a.author_id
+     GROUP BY b.book_id
+     ORDER BY b.book_id
+     LIMIT %s OFFSET %s
+"""
+
+_SQL_ADD_BOOK = """
+    INSERT INTO book (title, isbn, pub_year, genre_id, publisher_id)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+_SQL_DELETE_BOOK = "DELETE FROM book WHERE book_id = %s"
+
+_SQL_UPDATE_BOOK = """
+    UPDATE book
+       SET title = %s,
+           isbn = %s,
+           pub_year = %s,
+           genre_id = %s,
+           publisher_id = %s
+     WHERE book_id = %s
+"""
+
+_SQL_BOOK_BY_NAME = """
+    SELECT book_id, title, isbn, pub_year, genre_id, publisher_id, NULL AS authors
+      FROM book
+     WHERE title = %s
+"""
+
+_SQL_BOOKS_BY_AUTHOR = """
+    SELECT b.book_id,
+           b.title,
+           b.isbn,
+           b.pub_year,
+           b.genre_id,
+           b.publisher_id,
+           a.name AS authors
+      FROM book b
+      JOIN book_author ba ON b.book_id = ba.book_id
+      JOIN author a ON ba.author_id = a.author_id
+     WHERE a.name = %s
+"""
+
+_SQL_FIRST_BOOK_BY_AUTHOR = """
+    SELECT b.book_id,
+           b.title,
+           b.isbn,
+           b.pub_year,
+           b.genre_id,
+           b.publisher_id,
+           a.name AS authors
+      FROM book b
+      JOIN book_author ba ON b.book_id = ba.book_id
+      JOIN author a ON ba.author_id = a.author_id
+     WHERE a.name = %s
+     LIMIT 1
+"""
+
+_SQL_PUBLISHERS = """
+    SELECT publisher_id, name, address, phone, email
+      FROM publisher
+     ORDER BY publisher_id
+     LIMIT %s OFFSET %s
+"""
+
+_SQL_MEMBERS = """
+    SELECT member_id, first_name, last_name, address, email, membership_date
+      FROM members
+     ORDER BY member_id
+     LIMIT %s OFFSET %s
+"""
+
+_SQL_RECENT_LOANS = """
+    SELECT loan_id, member_id, issue_date, due_date, return_date
+      FROM loan
+     ORDER BY loan_id DESC
+     LIMIT %s
+"""
+
+_SQL_LOANS_BEFORE = """
+    SELECT loan_id, member_id, issue_date, due_date, return_date
+      FROM loan
+     WHERE loan_id < %s
+     ORDER BY loan_id DESC
+     LIMIT %s
+"""
+
+_SQL_MEMBERS_BY_BOOK = """
+    SELECT m.first_name,
+           m.last_name,
+           b.title,
+           l.issue_date,
+           l.due_date,
+           l.return_date
+      FROM members m
+      JOIN loan l ON m.member_id = l.member_id
+      JOIN book_copy bc ON l.copy_id = bc.copy_id
+      JOIN book b ON bc.book_id = b.book_id
+     WHERE b.title = %s
+"""
+
+_SQL_MEMBERS_WITH_LOANS = """
+    SELECT DISTINCT m.member_id,
+                    m.first_name,
+                    m.last_name
+      FROM members m
+      JOIN loan l ON m.member_id = l.member_id
+"""
+
+# Indexes backing the lookups above: author name -> books, and book title -> loans.
+_SQL_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_author_name ON author (name)",
+    "CREATE INDEX IF NOT EXISTS idx_ba_author ON book_author (author_id, book_id)",
+    "CREATE INDEX IF NOT EXISTS idx_book_title ON book (title)",
+)
+
+
+def empty_book_columns() -> Dict[str, Sequence]:
+    """Returns an empty column per Book field, with IDs stored as 64-bit integers."""
+    columns: Dict[str, Sequence] = {field: [] for field in Book._fields}
+    columns["id"] = array("q")
+    return columns
+
 
 class Repository:
     """
@@ -11,7 +149,7 @@ class Repository:
     """
 
     def __init__(self) -> None:
-        """Initializes the Repository class and connects to the database."""
+        """Initializes the Repository class and opens the database connection pool."""
         self.db = Database()
         try:
             self.db.connect()
@@ -19,30 +157,62 @@ class Repository:
             logger.critical(f"Failed to connect to the database: {e}")
             raise RuntimeError("Database connection failed.")
 
+    def ensure_indexes(self) -> None:
+        """
+        Creates the indexes used by the author and title lookups if they do not exist yet.
+        Failures are logged and ignored, since the queries still work without the indexes.
+        """
+        for statement in _SQL_INDEXES:
+            try:
+                self.db.execute_query(query=statement)
+            except Exception as e:
+                logger.warning(f"Failed to ensure index ({statement}): {e}")
+
     # -------------------------------------------------------------------------
     # 1. BOOK QUERIES
     # -------------------------------------------------------------------------
 
-    def fetchall_books(self) -> List[Book]:
+    def fetchall_books(self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0) -> List[Book]:
         """
-        Fetches all books, joining with the author via the book_author join table.
-        If a book has multiple authors, you might need to concatenate them.
-        Here we assume one author per book for simplicity.
-        """
-        query = """
-            SELECT b.book_id, b.title, a.name AS author, b.isbn, b.pub_year, b.genre_id, b.publisher_id
-                FROM book b
-                LEFT JOIN book_author ba ON b.book_id = ba.book_id
-                LEFT JOIN author a ON ba.author_id = a.author_id
+        Fetches a page of books, joining with the author via the book_author join table.
+        Multiple authors are concatenated into a single column, so each book is
+        returned exactly once.
+
+        Args:
+            limit (int): The maximum number of books to return.
+            offset (int): The number of books to skip.
         """
+        params = (limit, offset)
         try:
-            results = self.db.fetch_results(query=query)
-            # Create Book objects assuming the Book model accepts these parameters
-            return [Book(row[0], row[1], row[2], row[3], row[4], row[5], row[6]) for row in results]
+            results = self.db.fetch_results(query=_SQL_FETCHALL_BOOKS, params=params)
+            return [Book._make(row) for row in results]
         except Exception as e:
             logger.error(f"Failed to fetch all books: {e}")
             return []
 
+    def fetchall_books_columnar(self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0) -> Dict[str, Sequence]:
+        """
+        Fetches the same page as fetchall_books, laid out as one sequence per Book field
+        instead of one Book per row. Book IDs are packed into an array of 64-bit integers.
+
+        Args:
+            limit (int): The maximum number of books to return.
+            offset (int): The number of books to skip.
+
+        Returns:
+            Dict[str, Sequence]: A mapping from Book field name to its column of values.
+        """
+        columns = empty_book_columns()
+        appenders = [columns[field].append for field in Book._fields]
+        params = (limit, offset)
+        try:
+            for row in self.db.fetch_results(query=_SQL_FETCHALL_BOOKS, params=params):
+                for append, value in zip(appenders, row):
+                    append(value)
+            return columns
+        except Exception as e:
+            logger.error(f"Failed to fetch all books: {e}")
+            return empty_book_columns()
 
     def add_book(self, book: Book) -> None:
         """
@@ -51,10 +221,6 @@ class Repository:
         Args:
             book (Book): The book object to be added.
         """
-        query = """
-            INSERT INTO book (title, isbn, pub_year, genre_id, publisher_id)
-            VALUES (%s, %s, %s, %s, %s)
-        """
         params = (
             book.title,
             book.isbn,
@@ -63,12 +229,30 @@ class Repository:
             book.publisher_id
         )
         try:
-            self.db.execute_query(query=query, params=params)
+            self.db.execute_query(query=_SQL_ADD_BOOK, params=params)
             logger.info(f"Book '{book.title}' added successfully.")
         except Exception as e:
             logger.error(f"Failed to add book '{book.title}': {e}")
             raise RuntimeError("Failed to add book.")
 
+    def add_books(self, books: List[Book]) -> None:
+        """
+        Adds several books to the 'book' table in one transaction.
+
+        Args:
+            books (List[Book]): The book objects to be added.
+        """
+        params_seq = (
+            (book.title, book.isbn, book.pub_year, book.genre_id, book.publisher_id)
+            for book in books
+        )
+        try:
+            self.db.execute_many(query=_SQL_ADD_BOOK, params_seq=params_seq)
+            logger.info(f"{len(books)} books added successfully.")
+        except Exception as e:
+            logger.error(f"Failed to add {len(books)} books: {e}")
+            raise RuntimeError("Failed to add books.")
+
     def delete_book_by_id(self, book_id: int) -> None:
         """
         Deletes a book by its primary key (book_id).
@@ -76,10 +260,9 @@ class Repository:
         Args:
             book_id (int): The ID of the book to delete.
         """
-        query = "DELETE FROM book WHERE book_id = %s"
         params = (book_id,)
         try:
-            self.db.execute_query(query=query, params=params)
+            self.db.execute_query(query=_SQL_DELETE_BOOK, params=params)
             logger.info(f"Book with ID {book_id} deleted successfully.")
         except Exception as e:
             logger.error(f"Failed to delete book with ID {book_id}: {e}")
@@ -92,15 +275,6 @@ class Repository:
         Args:
             book (Book): The book object with updated information.
         """
-        query = """
-            UPDATE book
-               SET title = %s,
-                   isbn = %s,
-                   pub_year = %s,
-                   genre_id = %s,
-                   publisher_id = %s
-             WHERE book_id = %s
-        """
         params = (
             book.title,
             book.isbn,
@@ -110,7 +284,7 @@ class Repository:
             book.id  # use book.id (the model's field) which corresponds to book_id
         )
         try:
-            self.db.execute_query(query=query, params=params)
+            self.db.execute_query(query=_SQL_UPDATE_BOOK, params=params)
             logger.info(f"Book with ID {book.id} updated successfully.")
         except Exception as e:
             logger.error(f"Failed to update book with ID {book.id}: {e}")
@@ -126,15 +300,10 @@ class Repository:
         Returns:
             Optional[Book]: The Book object if found, otherwise None.
         """
-        query = """
-            SELECT book_id, title, isbn, pub_year, genre_id, publisher_id
-              FROM book
-             WHERE title = %s
-        """
         params = (book_name,)
         try:
-            result = self.db.fetch_results(query=query, params=params)
-            return Book(*result[0]) if result else None
+            result = self.db.fetch_results(query=_SQL_BOOK_BY_NAME, params=params)
+            return Book._make(result[0]) if result else None
         except Exception as e:
             logger.error(f"Failed to fetch book '{book_name}': {e}")
             return None
@@ -149,22 +318,10 @@ class Repository:
         Fetches books by the given author name.
         Uses the book_author join table and the author table.
         """
-        query = """
-            SELECT b.book_id,
-                   b.title,
-                   b.isbn,
-                   b.pub_year,
-                   b.genre_id,
-                   b.publisher_id
-              FROM book b
-              JOIN book_author ba ON b.book_id = ba.book_id
-              JOIN author a ON ba.author_id = a.author_id
-             WHERE a.name = %s
-        """
         params = (author_name,)
         try:
-            results = self.db.fetch_results(query=query, params=params)
-            return [Book(*row) for row in results]
+            results = self.db.fetch_results(query=_SQL_BOOKS_BY_AUTHOR, params=params)
+            return [Book._make(row) for row in results]
         except Exception as e:
             logger.error(f"Failed to fetch books by author '{author_name}': {e}")
             return []
@@ -173,23 +330,10 @@ class Repository:
         """
         Fetches a single book (first match) by the author's name.
         """
-        query = """
-            SELECT b.book_id,
-                   b.title,
-                   b.isbn,
-                   b.pub_year,
-                   b.genre_id,
-                   b.publisher_id
-              FROM book b
-              JOIN book_author ba ON b.book_id = ba.book_id
-              JOIN author a ON ba.author_id = a.author_id
-             WHERE a.name = %s
-             LIMIT 1
-        """
         params = (author_name,)
         try:
-            result = self.db.fetch_results(query=query, params=params)
-            return Book(*result[0]) if result else None
+            result = self.db.fetch_results(query=_SQL_FIRST_BOOK_BY_AUTHOR, params=params)
+            return Book._make(result[0]) if result else None
         except Exception as e:
             logger.error(f"Failed to fetch book by author '{author_name}': {e}")
             return None
@@ -198,70 +342,78 @@ class Repository:
     # 3. PUBLISHER QUERIES
     # -------------------------------------------------------------------------
 
-    def get_publisher(self) -> List[Publisher]:
+    def get_publisher(self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0) -> List[Publisher]:
         """
-        Fetches all publishers from the 'publisher' table.
+        Fetches a page of publishers from the 'publisher' table.
+
+        Args:
+            limit (int): The maximum number of publishers to return.
+            offset (int): The number of publishers to skip.
 
         Returns:
             List[Publisher]: A list of Publisher objects.
+
+        Raises:
+            RuntimeError: If the publishers cannot be fetched, so callers caching
+                the result can tell a failure apart from an empty table.
         """
-        query = """
-            SELECT publisher_id, name, address, phone, email
-              FROM publisher
-        """
+        params = (limit, offset)
         try:
-            results = self.db.fetch_results(query=query)
-            return [Publisher(*row) for row in results]
+            results = self.db.fetch_results(query=_SQL_PUBLISHERS, params=params)
+            return [Publisher._make(row) for row in results]
         except Exception as e:
             logger.error(f"Failed to fetch publishers: {e}")
-            return []
+            raise RuntimeError("Failed to fetch publishers.")
 
     # -------------------------------------------------------------------------
     # 4. MEMBER QUERIES
     # -------------------------------------------------------------------------
 
-    def get_all_members(self) -> List[Member]:
+    def get_all_members(self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0) -> List[Member]:
         """
-        Fetches all members from the 'member' table.
+        Fetches a page of members from the 'member' table.
+
+        Args:
+            limit (int): The maximum number of members to return.
+            offset (int): The number of members to skip.
 
         Returns:
             List[Member]: A list of Member objects.
+
+        Raises:
+            RuntimeError: If the members cannot be fetched, so callers caching
+                the result can tell a failure apart from an empty table.
         """
-        query = """
-            SELECT member_id, first_name, last_name, address, email, membership_date
-              FROM members
-        """
+        params = (limit, offset)
         try:
-            results = self.db.fetch_results(query=query)
-            return [Member(*row) for row in results]
+            results = self.db.fetch_results(query=_SQL_MEMBERS, params=params)
+            return [Member._make(row) for row in results]
         except Exception as e:
             logger.error(f"Failed to fetch members: {e}")
-            return []
+            raise RuntimeError("Failed to fetch members.")
 
     # -------------------------------------------------------------------------
     # 5. LOAN & BORROWING QUERIES
     # -------------------------------------------------------------------------
 
-    def list_all_loan(self) -> List[tuple]:
+    def list_recent_loans(self, before_id: Optional[int] = None, page_size: int = LOAN_PAGE_SIZE) -> List[tuple]:
         """
-        Fetches all loans from the 'loan' table.
+        Fetches a page of loans from the 'loan' table, newest first.
+
+        Args:
+            before_id (Optional[int]): Only loans with a smaller loan_id are returned;
+                pass the last loan_id of the previous page, or None for the first page.
+            page_size (int): The maximum number of loans to return.
 
         Returns:
-            List[tuple]: A list of tuples containing loan information.
-        """
-        query = """
-            SELECT loan_id,
-                   copy_id,
-                   member_id,
-                   staff_id,
-                   librarian_id,
-                   issue_date,
-                   due_date,
-                   return_date
-              FROM loan
+            List[tuple]: A list of (loan_id, member_id, issue_date, due_date, return_date) tuples.
         """
+        if before_id is None:
+            query, params = _SQL_RECENT_LOANS, (page_size,)
+        else:
+            query, params = _SQL_LOANS_BEFORE, (before_id, page_size)
         try:
-            return self.db.fetch_results(query=query)
+            return self.db.fetch_results(query=query, params=params)
         except Exception as e:
             logger.error(f"Failed to fetch loans: {e}")
             return []
@@ -275,33 +427,21 @@ class Repository:
 
         Returns:
             List[tuple]: A list of tuples containing member and loan information.
-        """
-        book = self.list_book_by_name(book_name)
-        if not book:
-            logger.warning(f"No book found with title '{book_name}'.")
-            return []
 
-        query = """
-            SELECT m.first_name,
-                   m.last_name,
-                   b.title,
-                   l.issue_date,
-                   l.due_date,
-                   l.return_date
-              FROM members m 
-              JOIN loan l ON m.member_id = l.member_id
-              JOIN book_copy bc ON l.copy_id = bc.copy_id
-              JOIN book b ON bc.book_id = b.book_id
-             WHERE b.book_id = %s
+        Note:
+            The title filter is applied inside the join, so book(title) should be indexed.
         """
-        # Use book.id from our model instead of book.book_id
-        params = (book.id,)
+        params = (book_name,)
         try:
-            return self.db.fetch_results(query=query, params=params)
+            rows = self.db.fetch_results(query=_SQL_MEMBERS_BY_BOOK, params=params)
         except Exception as e:
             logger.error(f"Failed to fetch members for book '{book_name}': {e}")
             return []
 
+        if not rows:
+            logger.warning(f"No loans found for book titled '{book_name}'.")
+        return rows
+
     def list_members_borrowed_at_least_one_book(self) -> List[tuple]:
         """
         Fetches all members who have borrowed at least one book.
@@ -309,15 +449,21 @@ class Repository:
         Returns:
             List[tuple]: A list of tuples containing member information.
         """
-        query = """
-            SELECT DISTINCT m.member_id,
-                            m.first_name,
-                            m.last_name
-              FROM members m
-              JOIN loan l ON m.member_id = l.member_id
-        """
         try:
-            return self.db.fetch_results(query=query)
+            return self.db.fetch_results(query=_SQL_MEMBERS_WITH_LOANS)
         except Exception as e:
             logger.error(f"Failed to fetch members who borrowed at least one book: {e}")
             return []
+
+
+@lru_cache(maxsize=1)
+def get_repository() -> Repository:
+    """
+    Returns the shared Repository instance.
+
+    The repository is created on first use and reused by every controller, so the
+    application connects to the database and checks its indexes only once.
+    """
+    repository = Repository()
+    repository.ensure_indexes()
+    return repository
@@ -19,5 +19,9 @@ def setup_logger():
     return logger
 
 
+def cell_text(value) -> str:
+    """Converts a database value to table text, showing NULL as an empty cell."""
+    return "" if value is None else str(value)
+
 
 logger = setup_logger()
@@ -5,8 +5,9 @@ from PyQt5.QtWidgets import (
     QTableWidget, QTableWidgetItem, QMessageBox
 )
 
-from controller import BookController
-from utils import logger
+from controller import DEFAULT_PAGE_SIZE, BookController
+from utils import cell_text, logger
+from view.paging import PageControls
 
 
 class BookTab(QWidget):
@@ -29,9 +30,13 @@ class BookTab(QWidget):
         self.create_buttons()
         self.setup_books_table()
 
+        self.page_controls = PageControls(DEFAULT_PAGE_SIZE)
+        self.page_controls.page_changed.connect(lambda _offset: self.refresh_book_table())
+
         self.main_layout.addLayout(self.form_layout)
         self.main_layout.addLayout(self.button_layout)
         self.main_layout.addWidget(self.books_table)
+        self.main_layout.addWidget(self.page_controls)
         self.setLayout(self.main_layout)
 
     def get_stylesheet(self) -> str:
@@ -70,6 +75,9 @@ class BookTab(QWidget):
             QPushButton:hover {
                 background-color: #5a009e;   /* Slightly darker shade on hover */
             }
+            QPushButton:disabled {
+                background-color: #b9a3cc;   /* Faded purple when unavailable */
+            }
 
             /* Table styling for a clean and modern look */
             QTableWidget {
@@ -132,19 +140,21 @@ class BookTab(QWidget):
         self.books_table.horizontalHeader().setStretchLastSection(True)
 
     def refresh_book_table(self) -> None:
-        """Refresh the book table with the latest records from the database."""
+        """Refresh the book table with the current page of records from the database."""
         try:
-            self.books_table.setRowCount(0)
-            books = self.controller.getall()
-
-            for book_index, book in enumerate(books):
-                self.books_table.insertRow(book_index)
-                self.books_table.setItem(book_index, 0, QTableWidgetItem(str(book.id)))
-                self.books_table.setItem(book_index, 1, QTableWidgetItem(book.title))
-                self.books_table.setItem(book_index, 2, QTableWidgetItem(book.author))
-                self.books_table.setItem(book_index, 3, QTableWidgetItem(str(book.publisher_id)))
-                self.books_table.setItem(book_index, 4, QTableWidgetItem(book.isbn))
-                self.books_table.setItem(book_index, 5, QTableWidgetItem(str(book.year_published)))
+            offset = self.page_controls.offset
+            columns = self.controller.getall_columnar(offset=offset)
+            # One display column per table column, converted to text a whole column at a time.
+            display_columns = [
+                list(map(cell_text, columns[field]))
+                for field in ("id", "title", "authors", "publisher_id", "isbn", "pub_year")
+            ]
+
+            self.books_table.setRowCount(len(columns["id"]))
+            for col_index, values in enumerate(display_columns):
+                for row_index, value in enumerate(values):
+                    self.books_table.setItem(row_index, col_index, QTableWidgetItem(value))
+            self.page_controls.update_page(len(columns["id"]), offset)
         except Exception as e:
             logger.critical(f"Failed to refresh the book table: {e}")
             QMessageBox.critical(self, "Error", "Failed to retrieve books. Check the logs for details.")
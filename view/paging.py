@@ -0,0 +1,60 @@
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QPushButton, QLabel
+
+
+class PageControls(QWidget):
+    """Previous/next buttons and a row range label for a table filled one page at a time."""
+
+    page_changed = pyqtSignal(int)
+
+    def __init__(self, page_size: int) -> None:
+        """Initialize the controls for pages of page_size rows, starting at the first page."""
+        super().__init__()
+        self.page_size = page_size
+        self.offset = 0
+
+        self.previous_button = QPushButton("◀ Previous")
+        self.next_button = QPushButton("Next ▶")
+        self.range_label = QLabel()
+
+        self.previous_button.clicked.connect(self.go_previous)
+        self.next_button.clicked.connect(self.go_next)
+
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.previous_button)
+        layout.addWidget(self.range_label, 1)
+        layout.addWidget(self.next_button)
+        self.setLayout(layout)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Return to the first page and clear the row range."""
+        self.offset = 0
+        self.previous_button.setEnabled(False)
+        self.next_button.setEnabled(False)
+        self.range_label.clear()
+
+    def update_page(self, row_count: int, offset: int) -> None:
+        """Show the rows of the page fetched at offset; a full page means more rows may follow."""
+        self.offset = offset
+        has_more = row_count == self.page_size
+        self.previous_button.setEnabled(self.offset > 0)
+        self.next_button.setEnabled(has_more)
+
+        if row_count == 0:
+            self.range_label.setText("No rows")
+        else:
+            text = f"Rows {self.offset + 1}–{self.offset + row_count}"
+            self.range_label.setText(f"{text} (more available)" if has_more else text)
+
+    def go_previous(self) -> None:
+        """Move to the previous page."""
+        self.offset = max(0, self.offset - self.page_size)
+        self.page_changed.emit(self.offset)
+
+    def go_next(self) -> None:
+        """Move to the next page."""
+        self.offset += self.page_size
+        self.page_changed.emit(self.offset)
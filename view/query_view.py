@@ -1,13 +1,17 @@
 from enum import Enum
-from typing import List, Dict
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
+from PyQt5.QtCore import QThreadPool
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton,
     QTableWidget, QFormLayout, QLabel, QLineEdit, QMessageBox, QTableWidgetItem
 )
 
-from controller import QueryController
-from utils import logger
+from controller import DEFAULT_PAGE_SIZE, QueryController
+from utils import cell_text, logger
+from view.paging import PageControls
+from view.worker import QueryWorker
 
 
 class QueryIndex(Enum):
@@ -27,10 +31,66 @@ QUERY_DESCRIPTIONS: Dict[int, str] = {
 }
 
 
+def _stringify(getter: Callable[[Any], Tuple[Any, ...]]) -> Callable[[Any], List[str]]:
+    """Builds a row formatter that extracts the columns with getter and converts each one to text."""
+    return lambda row: list(map(cell_text, getter(row)))
+
+
+_BOOK_GET = attrgetter('id', 'title', 'publisher_id', 'isbn', 'pub_year')
+_PUBLISHER_GET = attrgetter('id', 'name', 'address', 'phone', 'email')
+_MEMBER_GET = attrgetter('id', 'first_name', 'last_name', 'email', 'address', 'membership_date')
+_MEMBER_LOAN_GET = itemgetter(0, 1, 2, 3, 4, 5)
+_MEMBER_NAME_GET = itemgetter(0, 1, 2)
+
+# Table headers and row formatter for each query, built once at import time.
+QUERY_LAYOUTS: Dict[int, Tuple[List[str], Callable]] = {
+    # Book model (without author field)
+    QueryIndex.FIND_BOOKS_BY_AUTHOR.value: (
+        ["Book ID", "Title", "Publisher ID", "ISBN", "Pub Year"],
+        _stringify(_BOOK_GET)
+    ),
+    QueryIndex.LIST_ALL_PUBLISHER.value: (
+        ["Publisher ID", "Name", "Address", "Phone", "Email"],
+        _stringify(_PUBLISHER_GET)
+    ),
+    # Member model (without phone field)
+    QueryIndex.LIST_ALL_MEMBER.value: (
+        ["Member ID", "First Name", "Last Name", "Email", "Address", "Membership Date"],
+        _stringify(_MEMBER_GET)
+    ),
+    QueryIndex.LIST_MEMBER_BY_BOOK.value: (
+        ['First Name', 'Last Name', 'Title', "Issue Date", "Due Date", "Return Date"],
+        _stringify(_MEMBER_LOAN_GET)
+    ),
+    # The three columns returned by the query
+    QueryIndex.LIST_MEMBER_BORROWED_AT_LEAST_ONE_BOOK.value: (
+        ['Member ID', 'First Name', 'Last Name'],
+        _stringify(_MEMBER_NAME_GET)
+    ),
+}
+
+
+# Queries that return one page of DEFAULT_PAGE_SIZE rows at a time.
+PAGED_QUERIES = {
+    QueryIndex.LIST_ALL_PUBLISHER.value,
+    QueryIndex.LIST_ALL_MEMBER.value,
+}
+
+
 class QueryTab(QWidget):
     def __init__(self) -> None:
         super().__init__()
         self.controller = QueryController()
+        self.thread_pool = QThreadPool.globalInstance()
+        # The query currently running in the background and the page offset it was started with.
+        self._pending: Optional[Tuple[QueryIndex, int]] = None
+        self._dispatch: Dict[int, Callable[[], None]] = {
+            QueryIndex.FIND_BOOKS_BY_AUTHOR.value: self.execute_get_books_by_author,
+            QueryIndex.LIST_ALL_PUBLISHER.value: self.execute_list_all_publisher,
+            QueryIndex.LIST_ALL_MEMBER.value: self.execute_get_all_members,
+            QueryIndex.LIST_MEMBER_BY_BOOK.value: self.execute_list_all_members_by_book,
+            QueryIndex.LIST_MEMBER_BORROWED_AT_LEAST_ONE_BOOK.value: self.execute_list_members_borrowed_at_least_one_book,
+        }
         self.init_ui()
 
     def init_ui(self) -> None:
@@ -62,10 +122,15 @@ class QueryTab(QWidget):
         self.result_table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.result_table.horizontalHeader().setStretchLastSection(True)
 
+        # Paging controls for the paged listings
+        self.page_controls = PageControls(DEFAULT_PAGE_SIZE)
+        self.page_controls.page_changed.connect(lambda _offset: self.run_selected_query())
+
         # Adding layouts
         self.main_layout.addLayout(self.top_layout)
         self.main_layout.addLayout(self.form_layout)
         self.main_layout.addWidget(self.result_table)
+        self.main_layout.addWidget(self.page_controls)
         self.setLayout(self.main_layout)
 
         # Styling the UI
@@ -106,6 +171,9 @@ class QueryTab(QWidget):
             QPushButton:hover {
                 background-color: #5a009e;
             }
+            QPushButton:disabled {
+                background-color: #b9a3cc;
+            }
             QTableWidget {
                 border: 1px solid #ddd;
                 font-size: 13px;
@@ -122,86 +190,46 @@ class QueryTab(QWidget):
         selected_index = self.query_combo.currentIndex()
         self.author_input.setVisible(selected_index == QueryIndex.FIND_BOOKS_BY_AUTHOR.value)
         self.book_input.setVisible(selected_index == QueryIndex.LIST_MEMBER_BY_BOOK.value)
+        self.page_controls.setVisible(selected_index in PAGED_QUERIES)
+        self.page_controls.reset()
 
     def execute_query(self) -> None:
-        """Execute the selected query and display results."""
-        current_index = self.query_combo.currentIndex()
-        if current_index == QueryIndex.FIND_BOOKS_BY_AUTHOR.value:
-            self.execute_get_books_by_author()
-        elif current_index == QueryIndex.LIST_ALL_PUBLISHER.value:
-            self.execute_list_all_publisher()
-        elif current_index == QueryIndex.LIST_ALL_MEMBER.value:
-            self.execute_get_all_members()
-        elif current_index == QueryIndex.LIST_MEMBER_BY_BOOK.value:
-            self.execute_list_all_members_by_book()
-        elif current_index == QueryIndex.LIST_MEMBER_BORROWED_AT_LEAST_ONE_BOOK.value:
-            self.execute_list_members_borrowed_at_least_one_book()
+        """Execute the selected query from its first page and display results."""
+        if self._pending is not None:
+            return
+        self.page_controls.reset()
+        self.run_selected_query()
+
+    def run_selected_query(self) -> None:
+        """Run the selected query for the current page."""
+        if self._pending is not None:
+            return
+        execute = self._dispatch.get(self.query_combo.currentIndex())
+        if execute is not None:
+            execute()
 
     def execute_get_books_by_author(self) -> None:
         author_name = self.author_input.text().strip()
         if not author_name:
             QMessageBox.warning(self, "Warning", "Author name is not provided.")
             return
-        try:
-            books = self.controller.get_books_by_author_name(author_name)
-        except Exception as e:
-            logger.debug(str(e))
-            QMessageBox.critical(self, "Error", "Failed to retrieve data. Check logs for debugging.")
-            return
-
-        # Updated headers and lambda according to the Book model (without author field)
-        self.populate_table(
-            books,
-            headers=["Book ID", "Title", "Publisher ID", "ISBN", "Pub Year"],
-            data_formatter=lambda book: [
-                str(book.id),
-                book.title,
-                str(book.publisher_id),
-                book.isbn,
-                str(book.pub_year)
-            ]
+        self.run_in_background(
+            QueryIndex.FIND_BOOKS_BY_AUTHOR,
+            lambda: self.controller.get_books_by_author_name(author_name)
         )
 
     def execute_list_all_publisher(self) -> None:
-        try:
-            publishers = self.controller.list_all_publisher()
-        except Exception as e:
-            logger.debug(str(e))
-            QMessageBox.critical(self, "Error", "Failed to retrieve data. Check logs for debugging.")
-            return
-
-        self.populate_table(
-            publishers,
-            headers=["Publisher ID", "Name", "Address", "Phone", "Email"],
-            data_formatter=lambda pub: [
-                str(pub.id),
-                pub.name,
-                pub.address,
-                pub.phone,
-                pub.email
-            ]
+        offset = self.page_controls.offset
+        self.run_in_background(
+            QueryIndex.LIST_ALL_PUBLISHER,
+            lambda: self.controller.list_all_publisher(offset=offset)
         )
 
     def execute_get_all_members(self) -> None:
-        try:
-            members = self.controller.get_all_members()
-        except Exception as e:
-            logger.debug(str(e))
-            QMessageBox.critical(self, "Error", "Failed to retrieve data. Check logs for debugging.")
-            return
-
-        # Updated headers and lambda according to the Member model (without phone field)
-        self.populate_table(
-            members,
-            headers=["Member ID", "First Name", "Last Name", "Email", "Address", "Membership Date"],
-            data_formatter=lambda mem: [
-                str(mem.id),
-                mem.first_name,
-                mem.last_name,
-                mem.email,
-                mem.address,
-                str(mem.membership_date)
-            ]
+        offset = self.page_controls.offset
+        self.run_in_background(
+            QueryIndex.LIST_ALL_MEMBER,
+            lambda: self.controller.get_all_members(offset=offset)
         )
 
     def execute_list_all_members_by_book(self) -> None:
@@ -209,41 +237,74 @@ class QueryTab(QWidget):
         if not book_name:
             QMessageBox.warning(self, "Warning", "Book title is not provided.")
             return
-        try:
-            results = self.controller.list_all_members_by_book(book_name)
-        except Exception as e:
-            logger.debug(str(e))
-            QMessageBox.critical(self, "Error", "Failed to retrieve data. Check logs for debugging.")
-            return
-
-        self.populate_table(
-            results,
-            headers=['First Name', 'Last Name', 'Title', "Issue Date", "Due Date", "Return Date"],
-            data_formatter=lambda r: [r[0], r[1], r[2], str(r[3]), str(r[4]), str(r[5])]
+        self.run_in_background(
+            QueryIndex.LIST_MEMBER_BY_BOOK,
+            lambda: self.controller.list_all_members_by_book(book_name)
         )
 
     def execute_list_members_borrowed_at_least_one_book(self) -> None:
-        try:
-            results = self.controller.list_members_borrowed_at_least_one_book()
-        except Exception as e:
-            logger.debug(str(e))
-            QMessageBox.warning(self, "Error", "Failed to retrieve data. Check logs for debugging.")
+        self.run_in_background(
+            QueryIndex.LIST_MEMBER_BORROWED_AT_LEAST_ONE_BOOK,
+            self.controller.list_members_borrowed_at_least_one_book
+        )
+
+    def run_in_background(self, query: QueryIndex, call: Callable[[], Any]) -> None:
+        """Run a controller call on the thread pool and populate the table with the query's layout."""
+        self._pending = (query, self.page_controls.offset)
+        self.set_form_enabled(False)
+
+        worker = QueryWorker(call)
+        worker.signals.finished.connect(self.on_query_finished)
+        worker.signals.failed.connect(self.on_query_failed)
+        self.thread_pool.start(worker)
+
+    def on_query_finished(self, results: List[object]) -> None:
+        """Display the results of the background query."""
+        query, offset = self._pending
+        self._pending = None
+        self.set_form_enabled(True)
+
+        if query.value != self.query_combo.currentIndex():
+            logger.debug(f"Dropping results of {query.name}: another query is selected.")
             return
 
-        # Updated headers and lambda to reflect the three columns returned
-        self.populate_table(
-            results,
-            headers=['Member ID', 'First Name', 'Last Name'],
-            data_formatter=lambda r: [str(r[0]), r[1], r[2]]
-        )
+        headers, data_formatter = QUERY_LAYOUTS[query.value]
+        self.populate_table(results, headers=headers, data_formatter=data_formatter)
+        if query.value in PAGED_QUERIES:
+            self.page_controls.update_page(len(results), offset)
+
+    def on_query_failed(self, message: str) -> None:
+        """Report a background query that raised an error."""
+        self._pending = None
+        self.set_form_enabled(True)
+        logger.debug(message)
+        QMessageBox.critical(self, "Error", "Failed to retrieve data. Check logs for debugging.")
+
+    def set_form_enabled(self, enabled: bool) -> None:
+        """Lock or unlock the query selection and inputs, so results always match the selected query."""
+        self.query_combo.setEnabled(enabled)
+        self.author_input.setEnabled(enabled)
+        self.book_input.setEnabled(enabled)
+        self.execute_button.setEnabled(enabled)
+        self.page_controls.setEnabled(enabled)
 
     def populate_table(self, items: List[object], headers: List[str], data_formatter: callable) -> None:
         """Helper method to populate the result table."""
-        self.result_table.setRowCount(0)
-        self.result_table.setColumnCount(len(headers))
-        self.result_table.setHorizontalHeaderLabels(headers)
-
-        for row_index, item in enumerate(items):
-            self.result_table.insertRow(row_index)
-            for col_index, data in enumerate(data_formatter(item)):
-                self.result_table.setItem(row_index, col_index, QTableWidgetItem(data))
\ No newline at end of file
+        table = self.result_table
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.clearContents()
+            table.setRowCount(len(items))
+            table.setColumnCount(len(headers))
+            table.setHorizontalHeaderLabels(headers)
+
+            set_item = table.setItem
+            for row_index, item in enumerate(items):
+                row_items = list(map(QTableWidgetItem, data_formatter(item)))
+                for col_index, widget_item in enumerate(row_items):
+                    set_item(row_index, col_index, widget_item)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
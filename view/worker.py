@@ -0,0 +1,30 @@
+from typing import Any, Callable
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a QueryWorker once its call has completed."""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class QueryWorker(QRunnable):
+    """Runs a controller call on a QThreadPool thread and reports the outcome through signals."""
+
+    def __init__(self, call: Callable[[], Any]) -> None:
+        """Initialize the worker with the call to run in the background."""
+        super().__init__()
+        self.call = call
+        self.signals = WorkerSignals()
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Invoke the call and emit either its result or the error message."""
+        try:
+            result = self.call()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)